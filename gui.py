@@ -1,12 +1,18 @@
 import os
+from functools import lru_cache
+from time import monotonic
 from typing import List
 
-from PySide6.QtCore import Qt, QPoint, QEvent, QSize, Signal
-from PySide6.QtGui import QIcon, QAction, QKeySequence, QShortcut, QPalette, QColor
+from PySide6.QtCore import (
+    Qt, QPoint, QEvent, QSize, Signal, Slot, QObject, QThread, QTimer,
+    QRunnable, QThreadPool,
+    QAbstractListModel, QModelIndex
+)
+from PySide6.QtGui import QIcon, QAction, QKeySequence, QShortcut, QPalette, QColor, QTextDocument
 from PySide6.QtWidgets import (
-    QWidget, QLabel, QVBoxLayout, QHBoxLayout, QPushButton, QApplication,
-    QListWidget, QListWidgetItem, QDialog, QProgressBar, QMessageBox, QTextBrowser,
-    QSizePolicy, QCheckBox, QFileDialog, QAbstractItemView
+    QWidget, QLabel, QVBoxLayout, QHBoxLayout, QPushButton,
+    QListView, QTreeView, QAbstractItemView, QDialog, QProgressBar, QMessageBox, QTextBrowser,
+    QSizePolicy, QCheckBox, QFileDialog
 )
 
 import processor
@@ -24,21 +30,43 @@ RADIUS_PANEL  = 10
 RADIUS_BTN    = 8
 GAP           = 10
 RESIZE_MARGIN = 8
+MOVE_INTERVAL = 0.016  # 移動/リサイズ反映の最短間隔（秒）≒ 60Hz
+SCAN_MAX_THREADS = 4   # 解析全体での同時走査数の上限（HDDを叩きすぎない程度）。ルート間で分け合う
+TITLE_INTERVAL = 0.1   # 削除中のタイトル更新の最短間隔（秒）≒ 10Hz
+LIST_BATCH_SIZE = 500  # 確認リストを1回のイベント処理でレイアウトする行数
+
+# eventFilter で毎回引く Qt の列挙値はモジュール定数にしておく
+_EVT_PRESS = QEvent.MouseButtonPress
+_EVT_MOVE = QEvent.MouseMove
+_EVT_RELEASE = QEvent.MouseButtonRelease
+_MOUSE_EVENTS = frozenset((_EVT_PRESS, _EVT_MOVE, _EVT_RELEASE))
+_LBTN = Qt.LeftButton
+_ARROW = Qt.ArrowCursor
+
+# 端判定のビットフラグ（上/下/左/右）
+EDGE_T, EDGE_B, EDGE_L, EDGE_R = 1, 2, 4, 8
+_EDGE_CURSOR_MAP = {
+    EDGE_T | EDGE_L: Qt.SizeFDiagCursor, EDGE_B | EDGE_R: Qt.SizeFDiagCursor,
+    EDGE_T | EDGE_R: Qt.SizeBDiagCursor, EDGE_B | EDGE_L: Qt.SizeBDiagCursor,
+    EDGE_L: Qt.SizeHorCursor, EDGE_R: Qt.SizeHorCursor,
+    EDGE_T: Qt.SizeVerCursor, EDGE_B: Qt.SizeVerCursor,
+}
 
 TITLE = "空フォルダ削除ツール ©️2025 KisaragiIchigo"
 
-def build_qss(compact: bool = False) -> str:
+def build_qss() -> str:
     grad = (
         "qlineargradient(x1:0, y1:0, x2:0, y2:1, "
         "stop:0 rgba(255,255,255,40), stop:0.5 rgba(200,220,255,20), stop:1 rgba(255,255,255,6))"
     )
-    glass_bg_image = "none" if compact else grad
     return f"""
     QWidget#bgRoot {{ background-color: rgba(0,0,0,0); border-radius:{RADIUS_WINDOW}px; }}
     QWidget#glassRoot {{
         background-color:{BG_GLASS}; border:{BORDER}; border-radius:{RADIUS_CARD}px;
-        background-image:{glass_bg_image}; background-repeat:no-repeat; background-position:0 0;
+        background-image:{grad}; background-repeat:no-repeat; background-position:0 0;
     }}
+    /* 最大化中は動的プロパティ compact でグラデーションを外す */
+    QWidget#glassRoot[compact="true"] {{ background-image:none; }}
     QLabel#titleLabel {{ color:#fff; font-weight:bold; font-size:8pt;}}
     QLabel#dropArea {{
         border: 2px dashed {PRIMARY}; border-radius:12px;
@@ -52,25 +80,17 @@ def build_qss(compact: bool = False) -> str:
         background:#2f2f2f; border-radius:{RADIUS_PANEL}px; border:1px solid #000; padding:8px;
     }}
 
-    /* === 選択リストの視認性UP === */
-    QListWidget {{
-        background:#fff5f7;           /* 未選択の地色 */
+    /* === 確認リストの視認性UP（削除対象はチェックで選ぶので選択ハイライトは使わない） === */
+    QListView {{
+        background:#fff5f7;           /* 地色 */
         color:#191970;                 /* 文字は濃紺でくっきり */
         border:1px solid #777;
         outline: none;
         alternate-background-color: #ffe9ef;   /* 交互行でコントラスト */
     }}
-    QListWidget::item {{
+    QListView::item {{
         padding: 4px 6px;              /* 当たり判定を広く */
     }}
-    QListWidget::item:selected {{
-        background: {PRIMARY};         /* 選択中の背景をブランド色に */
-        color: #fffafa;                /* 文字は白系でコントラスト最大化 */
-    }}
-    QListWidget::item:selected:active {{
-        background: {PRIMARY};
-        color: #fffafa;
-    }}
 
     QProgressBar {{ border:1px solid #555; border-radius:6px; background:#333; color:white; text-align:center; }}
     QProgressBar::chunk {{ background:{PRIMARY}; border-radius:6px; }}
@@ -78,11 +98,24 @@ def build_qss(compact: bool = False) -> str:
     QCheckBox {{ color:#fff; }}
     """
 
+# スタイルは QApplication に一度だけ設定する（main.py）。各ウィンドウでは再設定しない
+APP_QSS = build_qss()
+
+@lru_cache(maxsize=1)
+def app_icon() -> QIcon:
+    """アプリのアイコン（.ico の読み込み/デコードは一度だけ。無ければ空アイコン）"""
+    icon_path = utils.resource_path("karafo.ico")
+    return QIcon(icon_path) if os.path.exists(icon_path) else QIcon()
+
 #  共通：フレームレス移動＆端リサイズのベース
 class FramelessCard(QWidget):
     def __init__(self, title: str):
         super().__init__()
         self.setWindowTitle(title)
+        # アイコン（全ウィンドウで同じ QIcon を共有）
+        icon = app_icon()
+        if not icon.isNull():
+            self.setWindowIcon(icon)
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.Window)
         self.setAttribute(Qt.WA_TranslucentBackground)
 
@@ -123,59 +156,119 @@ class FramelessCard(QWidget):
         self._moving = False
         self._resizing = False
         self._drag_offset = QPoint()
+        self._cursor_shape = Qt.ArrowCursor  # 直近に設定したカーソル形状
+        self._last_move_ts = 0.0   # 直近に移動/リサイズを反映した時刻
+        self._pending_pos = None   # 間引いた最新のマウス位置（タイマーか離した時に反映）
+        # マウスが止まっても間引いた最後の位置が残らないよう、少し後に反映する
+        self._move_timer = QTimer(self)
+        self._move_timer.setSingleShot(True)
+        self._move_timer.timeout.connect(self._flush_pending_drag)
 
         self.bgRoot.setMouseTracking(True)
         self.bgRoot.installEventFilter(self)
 
-        self.setStyleSheet(build_qss(False))
+        self._qss_compact = False  # 現在適用中のスタイル（True=最大化用）
+
+    def _apply_qss(self, compact: bool):
+        """カードの compact プロパティを切り替え、カードだけ再polishする（QSSは再設定しない）"""
+        if compact == self._qss_compact:
+            return
+        self._qss_compact = compact
+        self.card.setProperty("compact", "true" if compact else "false")
+        style = self.card.style()
+        style.unpolish(self.card)
+        style.polish(self.card)
 
     def _toggle_max(self):
         if self.isMaximized():
             self.showNormal()
-            self.setStyleSheet(build_qss(False))
+            self._apply_qss(False)
             self.btnMax.setText("🗖")
         else:
             self.showMaximized()
-            self.setStyleSheet(build_qss(True))
+            self._apply_qss(True)
             self.btnMax.setText("❏")
 
     def eventFilter(self, obj, e):
+        # マウス以外（Paint/Polish/LayoutRequest など）は比較1回で素通し
+        et = e.type()
+        if et not in _MOUSE_EVENTS:
+            return False
         if obj is self.bgRoot:
-            if e.type() == QEvent.MouseButtonPress and e.button() == Qt.LeftButton:
-                pos = self.mapFromGlobal(e.globalPosition().toPoint())
-                if self._edge_at(pos):
+            if et == _EVT_PRESS and e.button() == _LBTN:
+                gpos = e.globalPosition().toPoint()
+                edges = self._edge_at(self.mapFromGlobal(gpos))
+                if edges:
                     self._resizing = True
-                    self._resize_edges = self._edge_at(pos)
+                    self._resize_edges = edges
                     self._start_geo = self.geometry()
-                    self._start_mouse = e.globalPosition().toPoint()
+                    self._start_mouse = gpos
                 else:
                     self._moving = True
-                    self._drag_offset = e.globalPosition().toPoint() - self.frameGeometry().topLeft()
+                    self._drag_offset = gpos - self.frameGeometry().topLeft()
                 return True
-            elif e.type() == QEvent.MouseMove:
-                if self._resizing:
-                    self._resize_to(e.globalPosition().toPoint()); return True
-                if self._moving and (e.buttons() & Qt.LeftButton) and not self.isMaximized():
-                    self.move(e.globalPosition().toPoint() - self._drag_offset); return True
-                self._update_cursor(self._edge_at(self.mapFromGlobal(e.globalPosition().toPoint())))
-            elif e.type() == QEvent.MouseButtonRelease:
+            elif et == _EVT_MOVE:
+                gpos = e.globalPosition().toPoint()
+                dragging = self._moving and (e.buttons() & _LBTN) and not self.isMaximized()
+                if self._resizing or dragging:
+                    now = monotonic()
+                    wait = MOVE_INTERVAL - (now - self._last_move_ts)
+                    if wait > 0:
+                        self._pending_pos = gpos  # 最新位置だけ覚えておく
+                        if not self._move_timer.isActive():
+                            self._move_timer.start(max(1, int(wait * 1000)))
+                        return True
+                    self._last_move_ts = now
+                    self._pending_pos = None
+                    self._apply_drag(gpos)
+                    return True
+                pos = self.mapFromGlobal(gpos)
+                # 内側（端のリサイズ帯より内側）なら端判定を省略して即抜ける
+                m = RESIZE_MARGIN; r = self.bgRoot.rect()
+                if m < pos.x() < r.width() - m and m < pos.y() < r.height() - m:
+                    if self._cursor_shape != _ARROW:
+                        self.setCursor(_ARROW)
+                        self._cursor_shape = _ARROW
+                    return False
+                # 端の帯では毎回判定する（形状が同じなら _update_cursor 側で setCursor を省く）
+                self._update_cursor(self._edge_at(pos))
+            elif et == _EVT_RELEASE:
+                self._move_timer.stop()
+                if self._pending_pos is not None:
+                    # 間引いた最後の位置を反映して、最終位置を正確にする
+                    self._apply_drag(self._pending_pos)
+                    self._pending_pos = None
                 self._resizing = False; self._moving = False; return True
         return super().eventFilter(obj, e)
 
-    def _edge_at(self, pos):
-        m = RESIZE_MARGIN; r = self.bgRoot.rect(); edges = ""
-        if pos.y() <= m: edges += "T"
-        if pos.y() >= r.height()-m: edges += "B"
-        if pos.x() <= m: edges += "L"
-        if pos.x() >= r.width()-m: edges += "R"
+    def _flush_pending_drag(self):
+        """間引いたまま残っている位置を反映（移動が止まった後のタイマーから呼ぶ）"""
+        if self._pending_pos is None or not (self._resizing or self._moving):
+            return
+        self._last_move_ts = monotonic()
+        self._apply_drag(self._pending_pos)
+        self._pending_pos = None
+
+    def _apply_drag(self, gpos):
+        """移動中/リサイズ中のマウス位置をウィンドウに反映"""
+        if self._resizing:
+            self._resize_to(gpos)
+        else:
+            self.move(gpos - self._drag_offset)
+
+    def _edge_at(self, pos) -> int:
+        m = RESIZE_MARGIN; r = self.bgRoot.rect(); edges = 0
+        if pos.y() <= m: edges |= EDGE_T
+        if pos.y() >= r.height()-m: edges |= EDGE_B
+        if pos.x() <= m: edges |= EDGE_L
+        if pos.x() >= r.width()-m: edges |= EDGE_R
         return edges
 
-    def _update_cursor(self, edges):
-        if edges in ("TL", "BR"): self.setCursor(Qt.SizeFDiagCursor)
-        elif edges in ("TR", "BL"): self.setCursor(Qt.SizeBDiagCursor)
-        elif edges in ("L", "R"): self.setCursor(Qt.SizeHorCursor)
-        elif edges in ("T", "B"): self.setCursor(Qt.SizeVerCursor)
-        else: self.setCursor(Qt.ArrowCursor)
+    def _update_cursor(self, edges: int):
+        shape = _EDGE_CURSOR_MAP.get(edges, _ARROW)
+        if shape != self._cursor_shape:  # 同じ形状なら setCursor しない
+            self.setCursor(shape)
+            self._cursor_shape = shape
 
     def _resize_to(self, gpos):
         dx = gpos.x() - self._start_mouse.x()
@@ -185,13 +278,13 @@ class FramelessCard(QWidget):
         minw, minh = self.minimumSize().width(), self.minimumSize().height()
         edges = self._resize_edges
 
-        if "L" in edges:
+        if edges & EDGE_L:
             new_w = max(minw, w - dx); x += (w - new_w); w = new_w
-        if "R" in edges:
+        if edges & EDGE_R:
             w = max(minw, w + dx)
-        if "T" in edges:
+        if edges & EDGE_T:
             new_h = max(minh, h - dy); y += (h - new_h); h = new_h
-        if "B" in edges:
+        if edges & EDGE_B:
             h = max(minh, h + dy)
         self.setGeometry(x, y, w, h)
 
@@ -212,31 +305,40 @@ class DropArea(QLabel):
             e.acceptProposedAction()
 
     def dropEvent(self, e):
-        files = [u.toLocalFile() for u in e.mimeData().urls()]
-        self.filesDropped.emit(files)
+        # フォルダだけに絞ってから通知する（空リストなら受け手で警告）
+        isdir = os.path.isdir
+        dirs = [p for p in (u.toLocalFile() for u in e.mimeData().urls()) if p and isdir(p)]
+        self.filesDropped.emit(dirs)
 
 #  README
 README_MD = r"""
 # 空フォルダ削除ツール ©️2025 KisaragiIchigo
 
 ## 概要
-指定フォルダ配下の「空フォルダ」を検索し、選択して一括削除できます。
+指定フォルダ配下の「空フォルダ」を検索し、チェックした項目を一括削除できます。
 
 ## 追加の安全・高速化オプション
 - **Thumbs.db / desktop.ini / .DS_Store** を無視して“実質空”として判定  
 - 上記ゴミファイルを先に削除してからフォルダ削除  
-- **高速リスキャン**：同一セッション内で再検索が速くなります（同じフォルダを続けて解析する時に有効）
+- **高速リスキャン**：再検索が速くなります（同じフォルダを続けて解析する時に有効）。キャッシュは終了時に scan_cache.json へ保存され、次回起動時も有効です
 
 ## 使い方
 1. メインの枠内に対象フォルダをD&D（または［フォルダを選択して解析］）  
-2. 検出結果ダイアログで削除したい項目を選択（既定：全選択）  
-3. **「選択したフォルダを削除」** を押す
+2. 検出結果ダイアログで削除したい項目にチェック（既定：全チェック。行をクリックしただけでは変わりません）  
+3. **「チェックしたフォルダを削除」** を押す
 
 ## 注意
 - 削除は元に戻せません。必要に応じてバックアップを作成してください。  
 - 削除に失敗した項目は、同フォルダにエラーログ（txt）が出力されます。  
 """
 
+@lru_cache(maxsize=1)
+def readme_html() -> str:
+    """README_MD を一度だけ HTML 化して使い回す（QApplication 生成後に呼ぶこと）"""
+    doc = QTextDocument()
+    doc.setMarkdown(README_MD)
+    return doc.toHtml()
+
 class ReadmeDialog(FramelessCard):
     def __init__(self, parent=None):
         super().__init__("README ©️2025 KisaragiIchigo")
@@ -246,7 +348,7 @@ class ReadmeDialog(FramelessCard):
 
         viewer = QTextBrowser(); viewer.setObjectName("readmeView")
         viewer.setOpenExternalLinks(True); viewer.setReadOnly(True)
-        viewer.setMarkdown(README_MD); v.addWidget(viewer, 1)
+        viewer.setHtml(readme_html()); v.addWidget(viewer, 1)
 
         row = QHBoxLayout()
         row.addStretch(1)
@@ -257,6 +359,76 @@ class ReadmeDialog(FramelessCard):
         self.cardLay.addWidget(panel, 1)
         self.resize(700, 520)
 
+# チェック状態（0/1）を一括反転するための変換表
+_INVERT_TABLE = bytes.maketrans(b"\x00\x01", b"\x01\x00")
+
+#  検出結果リストのモデル（ビューは見えている行だけ描画する）
+class EmptyFoldersModel(QAbstractListModel):
+    def __init__(self, paths: List[str], parent=None):
+        super().__init__(parent)
+        self._paths = paths
+        # チェック状態は1行1バイトで持つ（既定：全チェック）
+        self._sel = bytearray(b"\x01") * len(paths)
+        self._checked_count = len(paths)  # 件数表示用に増減で保持
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._paths)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == Qt.DisplayRole:
+            return self._paths[row]
+        if role == Qt.CheckStateRole:
+            return Qt.Checked if self._sel[row] else Qt.Unchecked
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        # 削除対象はチェック状態だけで決まるので、行の「選択」はさせない
+        return Qt.ItemIsEnabled | Qt.ItemIsUserCheckable
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if role != Qt.CheckStateRole or not index.isValid():
+            return False
+        row = index.row()
+        checked = 1 if Qt.CheckState(value) == Qt.Checked else 0
+        if checked == self._sel[row]:
+            return True
+        self._sel[row] = checked
+        self._checked_count += 1 if checked else -1
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+        return True
+
+    def _emit_all_changed(self):
+        """全行のチェック状態変更を1回の dataChanged で通知"""
+        if self._paths:
+            self.dataChanged.emit(self.index(0), self.index(len(self._paths) - 1), [Qt.CheckStateRole])
+
+    def select_all(self):
+        self._sel = bytearray(b"\x01") * len(self._paths)
+        self._checked_count = len(self._paths)
+        self._emit_all_changed()
+
+    def clear_selection(self):
+        self._sel = bytearray(len(self._paths))
+        self._checked_count = 0
+        self._emit_all_changed()
+
+    def invert(self):
+        """チェック反転"""
+        self._sel = self._sel.translate(_INVERT_TABLE)
+        self._checked_count = len(self._paths) - self._checked_count
+        self._emit_all_changed()
+
+    def checked_count(self) -> int:
+        return self._checked_count
+
+    def checked_paths(self) -> List[str]:
+        return [p for p, s in zip(self._paths, self._sel) if s]
+
 #  削除確認ダイアログ
 class ConfirmDialog(FramelessCard):
     def __init__(self, folders: List[str], parent=None):
@@ -267,39 +439,51 @@ class ConfirmDialog(FramelessCard):
         panel = QWidget(); panel.setProperty("class", "DarkPanel")
         lay = QVBoxLayout(panel); lay.setContentsMargins(8,8,8,8); lay.setSpacing(8)
 
-        # リスト
-        self.listw = QListWidget()
-        self.listw.setSelectionMode(QAbstractItemView.ExtendedSelection) 
-        self.listw.setFocusPolicy(Qt.StrongFocus)                         
+        # リスト（チェックで削除対象を選ぶ）
+        self.model = EmptyFoldersModel(folders, self)
+        self.listw = QListView()
+        # 設定が揃うまで途中のレイアウト/再描画を止めておく
+        self.listw.setUpdatesEnabled(False)
+        self.listw.setFocusPolicy(Qt.StrongFocus)
         self.listw.setAlternatingRowColors(True)
-        for p in folders:
-            it = QListWidgetItem(p)
-            it.setSelected(True) 
-            self.listw.addItem(it)
-        self.listw.selectAll() 
+        self.listw.setSelectionMode(QListView.NoSelection)
+        self.listw.setUniformItemSizes(True)
+        # 行のレイアウトは分割して進め、先頭の行から先に表示する
+        self.listw.setLayoutMode(QListView.Batched)
+        self.listw.setBatchSize(LIST_BATCH_SIZE)
+        pal = self.listw.palette()
+        pal.setColor(QPalette.AlternateBase, QColor("#ffe9ef"))
+        self.listw.setPalette(pal)
+        self.listw.setModel(self.model)
+        self.listw.setUpdatesEnabled(True)
 
-        QShortcut(QKeySequence.SelectAll, self.listw, self.listw.selectAll)
-        QShortcut(QKeySequence("Ctrl+D"), self.listw, self.listw.clearSelection)
-        QShortcut(QKeySequence("Ctrl+I"), self.listw, self._invert_selection)
+        QShortcut(QKeySequence.SelectAll, self.listw, self.model.select_all)
+        QShortcut(QKeySequence("Ctrl+D"), self.listw, self.model.clear_selection)
+        QShortcut(QKeySequence("Ctrl+I"), self.listw, self.model.invert)
 
         lay.addWidget(self.listw, 1)
 
-        # 選択件数ラベル
-        self.countLabel = QLabel(f"選択中: {len(folders)} 個")
-        self.listw.itemSelectionChanged.connect(self._on_sel_changed)
+        # チェック件数ラベル
+        self.countLabel = QLabel(f"チェック中: {len(folders)} 個")
+        # 連続したチェック変更はまとめて1回だけラベル更新
+        self._countTimer = QTimer(self)
+        self._countTimer.setSingleShot(True)
+        self._countTimer.setInterval(50)
+        self._countTimer.timeout.connect(self._update_count_label)
+        self.model.dataChanged.connect(self._on_sel_changed)
         lay.addWidget(self.countLabel)
 
         # ------------- 操作ボタン行 -------------
         btn_row = QHBoxLayout()
-        self.btnSelAll   = QPushButton("全選択")
+        self.btnSelAll   = QPushButton("全チェック")
         self.btnSelNone  = QPushButton("全解除")
         self.btnSelInvert= QPushButton("反転")
-        self.btnSelAll.setToolTip("すべて選択（Ctrl+A）")
+        self.btnSelAll.setToolTip("すべてチェック（Ctrl+A）")
         self.btnSelNone.setToolTip("すべて解除（Ctrl+D）")
-        self.btnSelInvert.setToolTip("選択を反転（Ctrl+I）")
-        self.btnSelAll.clicked.connect(self.listw.selectAll)
-        self.btnSelNone.clicked.connect(self.listw.clearSelection)
-        self.btnSelInvert.clicked.connect(self._invert_selection)
+        self.btnSelInvert.setToolTip("チェックを反転（Ctrl+I）")
+        self.btnSelAll.clicked.connect(self.model.select_all)
+        self.btnSelNone.clicked.connect(self.model.clear_selection)
+        self.btnSelInvert.clicked.connect(self.model.invert)
 
         btn_row.addWidget(self.btnSelAll)
         btn_row.addWidget(self.btnSelNone)
@@ -307,7 +491,7 @@ class ConfirmDialog(FramelessCard):
         btn_row.addStretch(1)
 
         # 右側：確定/中止
-        self.btnDelete = QPushButton("選択したフォルダを削除")
+        self.btnDelete = QPushButton("チェックしたフォルダを削除")
         self.btnCancel = QPushButton("キャンセル")
         btn_row.addWidget(self.btnDelete)
         btn_row.addWidget(self.btnCancel)
@@ -317,37 +501,86 @@ class ConfirmDialog(FramelessCard):
 
         self.cardLay.addWidget(panel, 1)
         self.resize(760, 540)
-        pal = self.listw.palette()
-        pal.setColor(QPalette.Highlight, QColor(PRIMARY))
-        pal.setColor(QPalette.HighlightedText, QColor("#fffafa"))
-        pal.setColor(QPalette.AlternateBase, QColor("#ffe9ef"))
-        self.listw.setPalette(pal)
-
-    def _invert_selection(self):
-        """選択反転"""
-        self.listw.blockSignals(True) 
-        for i in range(self.listw.count()):
-            it = self.listw.item(i)
-            it.setSelected(not it.isSelected())
-        self.listw.blockSignals(False)
-        self._on_sel_changed()
 
     def _on_sel_changed(self):
-        self.countLabel.setText(f"選択中: {len(self.selected_paths())} 個")
+        self._countTimer.start()  # 実行中なら再スタート
+
+    def _update_count_label(self):
+        self.countLabel.setText(f"チェック中: {self.model.checked_count()} 個")
 
     def selected_paths(self) -> List[str]:
-        return [i.text() for i in self.listw.selectedItems()]
+        return self.model.checked_paths()
+
+#  バックグラウンド処理（UIスレッドを止めない）
+class ScanSignals(QObject):
+    progress = Signal(str, int, str)  # (ルート, 走査済みフォルダ数, 現在のフォルダ名)
+    done = Signal(list)
+
+class ScanTask(QRunnable):
+    """1ルート分の空フォルダ検索（QThreadPool でルートごとに並列実行）"""
+    def __init__(self, root: str, fast_rescan: bool, max_workers: int):
+        super().__init__()
+        self.root = root
+        self.fast_rescan = fast_rescan
+        self.max_workers = max_workers  # このルートのサブツリー走査に使ってよいスレッド数
+        self.signals = ScanSignals()
+
+    def run(self):
+        empty: List[str] = []
+        try:
+            empty = processor.find_empty_folders(
+                [self.root],
+                ignore_known_garbage=True,
+                fast_rescan=self.fast_rescan,
+                progress_cb=self._report,
+                max_workers=self.max_workers,
+            )
+        except Exception as e:
+            utils.save_error_log(self.root, f"{type(e).__name__}: {e}")
+        try:
+            self.signals.done.emit(empty)
+        except RuntimeError:
+            pass  # 終了処理でシグナル側が先に破棄された（受け取る画面はもう無い）
+
+    def _report(self, scanned: int, _total: int, name: str):
+        try:
+            self.signals.progress.emit(self.root, scanned, name)
+        except RuntimeError:
+            pass  # 同上
+
+class DeleteWorker(QObject):
+    """空フォルダ削除を別スレッドで実行し、進捗を progress で通知する"""
+    progress = Signal(int, int, str)
+    finished = Signal(int)
+
+    def __init__(self, targets: List[str], remove_garbage: bool, fast_rescan: bool):
+        super().__init__()
+        self.targets = targets
+        self.remove_garbage = remove_garbage
+        self.fast_rescan = fast_rescan
+
+    @Slot()
+    def run(self):
+        removed = 0
+        try:
+            removed = processor.delete_empty_folders(
+                self.targets,
+                progress_cb=self.progress.emit,  # シグナル経由でUIスレッドへ
+                remove_known_garbage_files=self.remove_garbage,
+                ignore_known_garbage_for_empty=True,
+                max_pass=3,
+                fast_rescan=self.fast_rescan,
+                scan_workers=SCAN_MAX_THREADS,  # 検索と同じ同時実行数に揃える
+            )
+        except Exception as e:
+            utils.save_error_log(", ".join(self.targets), f"{type(e).__name__}: {e}")
+        self.finished.emit(removed)
 
 #  メインウィンドウ
 class MainWindow(FramelessCard):
     def __init__(self):
         super().__init__(TITLE)
 
-        # アイコン
-        icon_path = utils.resource_path("karafo.ico")
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
-
         # メインUI
         drop_panel = QWidget(); drop_panel.setProperty("class", "DarkPanel")
         v = QVBoxLayout(drop_panel)
@@ -389,38 +622,138 @@ class MainWindow(FramelessCard):
         act = QAction("READMEを開く", self); act.triggered.connect(self._show_readme)
         self.addAction(act)
 
-    def on_drop(self, paths: List[str]):
-        dirs = [p for p in paths if os.path.isdir(p)]
+        # 実行中のワーカー（同時に1つだけ）
+        self._thread = None
+        self._worker = None
+        # ルート並列スキャン用
+        self._scan_pool = QThreadPool(self)
+        self._scan_pool.setMaxThreadCount(SCAN_MAX_THREADS)
+        self._scan_tasks: List[ScanTask] = []
+        self._scan_results: List[str] = []
+        self._scan_counts = {}  # ルート -> 走査済みフォルダ数
+        self._scan_pending = 0
+        self._confirm_dlg = None
+        self._last_title_ts = 0.0
+        self._dir_dlg = None
+        self._readme = None
+
+    def on_drop(self, dirs: List[str]):
         if not dirs:
             QMessageBox.warning(self, "エラー", "フォルダをドロップしてね。")
             return
         self._process(dirs)
 
     # --- 手動選択 ---
-    def _select_and_process(self):
-        dlg = QFileDialog(self, "解析対象のフォルダを選択（Ctrl+A / Shift / Ctrl で複数可）", os.getcwd())
-        dlg.setFileMode(QFileDialog.FileMode.Directory)
-        dlg.setOption(QFileDialog.Option.ShowDirsOnly, True)
-        dlg.setOption(QFileDialog.Option.DontUseNativeDialog, True)
-        dlg.setOption(QFileDialog.Option.ReadOnly, True)
-        dlg.setLabelText(QFileDialog.Accept, "解析開始")
-        dlg.setLabelText(QFileDialog.Reject, "キャンセル")
+    def _folder_dialog(self) -> QFileDialog:
+        """
+        フォルダ選択ダイアログ（複数選択のため非ネイティブ）。構築が重いので初回だけ作って使い回す。
+        FileMode.Directory のままでは中の一覧が単一選択なので、一覧/詳細ビューを複数選択にする。
+        """
+        if self._dir_dlg is None:
+            dlg = QFileDialog(self, "解析対象のフォルダを選択（Ctrl+A / Shift / Ctrl で複数可）", os.getcwd())
+            dlg.setFileMode(QFileDialog.FileMode.Directory)
+            dlg.setOption(QFileDialog.Option.ShowDirsOnly, True)
+            dlg.setOption(QFileDialog.Option.DontUseNativeDialog, True)
+            # シンボリックリンク/ジャンクション先を辿らない（ネットワーク先の stat 待ちを避ける）
+            dlg.setOption(QFileDialog.Option.DontResolveSymlinks, True)
+            dlg.setOption(QFileDialog.Option.ReadOnly, True)
+            dlg.setLabelText(QFileDialog.Accept, "解析開始")
+            dlg.setLabelText(QFileDialog.Reject, "キャンセル")
+            for view in (dlg.findChild(QListView, "listView"), dlg.findChild(QTreeView, "treeView")):
+                if view is not None:
+                    view.setSelectionMode(QAbstractItemView.ExtendedSelection)
+            self._dir_dlg = dlg
+        return self._dir_dlg
 
+    def _select_and_process(self):
+        dlg = self._folder_dialog()
         if dlg.exec():
             paths = dlg.selectedFiles()
             if paths:
                 self._process(paths)
 
+    # --- ワーカーをスレッドで起動 ---
+    def _run_in_thread(self, worker: QObject, on_finished) -> None:
+        thread = QThread(self)
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        worker.finished.connect(on_finished)
+        worker.finished.connect(thread.quit)
+        worker.finished.connect(worker.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+        thread.finished.connect(self._on_thread_done)
+        self._thread, self._worker = thread, worker
+        thread.start()
+
+    def _on_thread_done(self):
+        self._thread = None
+        self._worker = None
+
+    def closeEvent(self, e):
+        # 実行中のスレッドを残したまま閉じると QThread ごと破棄されて落ちる（削除も途中で止まる）
+        if self._busy():
+            QMessageBox.information(self, "情報", "解析/削除の実行中は閉じられません。終わるまでお待ちください。")
+            e.ignore()
+            return
+        # 完了通知を出した直後のスキャンタスクが残っていれば終わるまで待つ
+        self._scan_pool.waitForDone()
+        super().closeEvent(e)
+
+    def _busy(self) -> bool:
+        return self._thread is not None or self._scan_pending > 0
+
+    def _set_busy(self, busy: bool):
+        """解析/削除の実行中は開始ボタンを押せないようにする"""
+        self.btnOpen.setEnabled(not busy)
+
     # --- 共通：解析～確認～削除 ---
     def _process(self, dirs: List[str]):
+        if self._busy():
+            return  # 解析/削除の実行中は受け付けない
+        roots = list(dict.fromkeys(dirs))
+        if not roots:
+            return
+        self._set_busy(True)
+        self.progress.setRange(0, 0)  # 総数が分からないのでビジー表示
+        self.titleLabel.setText(f"{TITLE}  解析中…")
+
+        fast_rescan = self.cb_fast_rescan.isChecked()
+        self._scan_results = []
+        self._scan_counts = {}
+        self._scan_pending = len(roots)
+        self._scan_tasks = []
+        # 同時に走るルート数で上限を分け合い、全体の同時走査数を SCAN_MAX_THREADS 程度に抑える
+        per_root = max(1, SCAN_MAX_THREADS // min(len(roots), SCAN_MAX_THREADS))
+        for root in roots:
+            task = ScanTask(root, fast_rescan, per_root)
+            task.signals.progress.connect(self._on_scan_progress, Qt.QueuedConnection)
+            task.signals.done.connect(self._on_root_scanned, Qt.QueuedConnection)
+            self._scan_tasks.append(task)  # 完了まで参照を保持
+            self._scan_pool.start(task)
+
+    @Slot(str, int, str)
+    def _on_scan_progress(self, root: str, scanned: int, name: str):
+        self._scan_counts[root] = scanned
+        total = sum(self._scan_counts.values())
+        self.titleLabel.setText(f"{TITLE}  解析中: {name} ({total} フォルダ)")
+
+    @Slot(list)
+    def _on_root_scanned(self, empty: List[str]):
+        self._scan_results.extend(empty)
+        self._scan_pending -= 1
+        if self._scan_pending > 0:
+            return
+        self._scan_tasks = []
+        self._scan_counts = {}
+        self.progress.setRange(0, 100)
         self.progress.setValue(0)
-        QApplication.processEvents()
+        self.titleLabel.setText(TITLE)
+        self._set_busy(False)
+        # ルート同士が重なっていても重複しないようにまとめ、表示用にここでだけ並べる
+        self._on_scan_finished(sorted(set(self._scan_results)))
+        self._scan_results = []
 
-        empty = processor.find_empty_folders(
-            dirs,
-            ignore_known_garbage=True,
-            fast_rescan=self.cb_fast_rescan.isChecked(),
-        )
+    def _on_scan_finished(self, empty: List[str]):
         if not empty:
             QMessageBox.information(self, "結果", "空フォルダは見つかりませんでした。")
             return
@@ -431,35 +764,52 @@ class MainWindow(FramelessCard):
         dlg.show()
 
     def _delete_selected(self, dlg: ConfirmDialog):
+        if self._busy():
+            return
         targets = dlg.selected_paths()
         if not targets:
-            QMessageBox.information(self, "情報", "削除対象が選択されていません。")
+            QMessageBox.information(self, "情報", "削除対象がチェックされていません。")
             return
 
-        # 進捗更新関数
-        def update_progress(curr: int, total: int, name: str):
+        self._confirm_dlg = dlg
+        self._set_busy(True)
+        worker = DeleteWorker(
+            targets,
+            remove_garbage=self.cb_remove_garbage.isChecked(),
+            fast_rescan=self.cb_fast_rescan.isChecked(),
+        )
+        # 進捗は必ずキュー経由でUIスレッドに届ける（processEvents で再入しない）
+        worker.progress.connect(self._update_progress, Qt.QueuedConnection)
+        self._run_in_thread(worker, self._on_delete_finished)
+
+    # 進捗更新（ワーカーのシグナルからUIスレッドで呼ばれる）
+    @Slot(int, int, str)
+    def _update_progress(self, curr: int, total: int, name: str):
+        if self.progress.maximum() != total:  # 範囲が変わる時だけ設定
             self.progress.setMaximum(total)
-            self.progress.setValue(curr)
+        self.progress.setValue(curr)
+        # タイトルは間引いて更新（最後の1件は必ず反映）
+        now = monotonic()
+        if now - self._last_title_ts >= TITLE_INTERVAL or curr == total:
+            self._last_title_ts = now
             self.titleLabel.setText(f"{TITLE}  削除中: {name} ({curr}/{total})")
-            QApplication.processEvents()
 
-        removed = processor.delete_empty_folders(
-            targets,
-            progress_cb=update_progress,
-            remove_known_garbage_files=self.cb_remove_garbage.isChecked(),
-            ignore_known_garbage_for_empty=True,
-            max_pass=3,
-            fast_rescan=self.cb_fast_rescan.isChecked(), # ★ fast_rescan を渡す
-        )
+    @Slot(int)
+    def _on_delete_finished(self, removed: int):
         self.titleLabel.setText(TITLE)
         self.progress.setValue(0)
-        dlg.close()
+        self._set_busy(False)
+        if self._confirm_dlg is not None:
+            self._confirm_dlg.close()
+            self._confirm_dlg = None
 
+        # キャッシュの掃除は processor.delete_empty_folders 側で済んでいる
         QMessageBox.information(self, "完了", f"{removed} 個の空フォルダを削除しました。")
-        # 削除した可能性のあるルート配下のキャッシュをクリア
-        for t in targets:
-            utils.cache_clear_under(t)
 
     def _show_readme(self):
-        r = ReadmeDialog(self)
-        r.show()
+        # 初回だけ生成し、以降は同じダイアログを前面に出し直す
+        if self._readme is None:
+            self._readme = ReadmeDialog(self)
+        self._readme.show()
+        self._readme.raise_()
+        self._readme.activateWindow()
@@ -1,13 +1,21 @@
+import atexit
 import sys
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont
 from PySide6.QtWidgets import QApplication
 import gui
+import utils
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
     app.setFont(QFont("メイリオ", 10))
+    app.setStyleSheet(gui.APP_QSS)  # 全ウィンドウ共通のスタイルは一度だけ
+
+    # 終了時に検索キャッシュを保存する
+    atexit.register(utils.save_cache)
 
     win = gui.MainWindow()
     win.show()
+    # 前回までのキャッシュの読み込みと掃除は表示後に裏で（件数やネットワーク先の待ちで起動を止めない）
+    utils.load_cache_in_background()
     sys.exit(app.exec())
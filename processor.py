@@ -1,6 +1,9 @@
 import os
 import stat # ★ chmod の権限付与に使うので import は残す
-from typing import Iterable, List, Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, count
+from time import monotonic
+from typing import Iterable, List, Callable, Sequence, Tuple
 import utils
 
 
@@ -10,32 +13,157 @@ import utils
 # _effective_count
 # _delete_known_garbage
 
+# サブツリー並列走査のスレッド数（I/O待ちが主なので CPU 数より多め）
+SCAN_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+# 検索中の進捗通知の間隔（フォルダ数）
+SCAN_PROGRESS_EVERY = 256
+# Windows のジャンクション/リパースポイント判定用（DirEntry.stat の st_file_attributes）
+_REPARSE_POINT = stat.FILE_ATTRIBUTE_REPARSE_POINT
+# 削除中の進捗通知の最短間隔（秒）≒ 60Hz
+PROGRESS_INTERVAL = 1 / 60
+
+
+def _scan_dir(
+    dirpath: str,
+    ignore_known_garbage: bool,
+    fast_rescan: bool,
+    mtime: int | None = None,
+) -> Tuple[bool, List[Tuple[str, int | None]]] | None:
+    """
+    フォルダを1回だけ scandir して (“実質空”か, 潜るサブフォルダ[(パス, mtime)]) を返す。
+    列挙できない場合は None（os.walk と同様に黙って飛ばす）。
+    - mtime: 親の scandir で得た自身の mtime（fast_rescan 時のキャッシュ照合に使う）。
+      キャッシュ上「空」のままなら、scandir せずに空と判定する。
+    """
+    if fast_rescan:
+        if mtime is None:
+            try:
+                # ルート自体がリンク/ジャンクションの場合もあるので、リンク先の mtime を見る
+                # （子フォルダの mtime は親の scandir で取ってから渡される）
+                mtime = os.stat(dirpath).st_mtime_ns
+            except OSError:
+                return None
+        cached = utils.cache_get(dirpath)
+        if cached and cached[0] == mtime and cached[1] == 0:
+            return True, []  # 変更なしの空フォルダ（中身を見る必要なし）
+
+    ignorable = utils.IGNORABLE_FILES  # frozenset。ループ内の属性参照を避ける
+    subdirs = []
+    has_dir = False
+    has_real_file = False
+    try:
+        with os.scandir(dirpath) as it:
+            for entry in it:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    has_dir = True
+                    # os.walk と同じく、リンク先のフォルダには潜らない
+                    # （Windows のジャンクションは is_symlink() が False なので潜る）
+                    if not entry.is_symlink():
+                        child_mtime = None
+                        if fast_rescan:
+                            # DirEntry の stat（Windows は列挙時の情報で追加I/Oなし）
+                            try:
+                                st = entry.stat(follow_symlinks=False)
+                                if getattr(st, "st_file_attributes", 0) & _REPARSE_POINT:
+                                    # ジャンクション等はリンク自身の mtime が変わらないので、リンク先を見る
+                                    st = os.stat(entry.path)
+                                child_mtime = st.st_mtime_ns
+                            except OSError:
+                                pass
+                        subdirs.append((entry.path, child_mtime))
+                elif not (ignore_known_garbage and entry.name in ignorable):
+                    has_real_file = True
+    except OSError:
+        return None
+    empty = not has_dir and not has_real_file
+    if fast_rescan:
+        utils.cache_set(dirpath, mtime, 0 if empty else 1)
+    return empty, subdirs
+
+def _walk_collect(
+    root: str,
+    root_mtime: int | None,
+    ignore_known_garbage: bool,
+    fast_rescan: bool,
+    counter=None,
+    progress_cb: Callable[[int, int, str], None] | None = None,
+) -> List[str]:
+    """1サブツリー分をスタックで走査して空フォルダを返す（スレッドプールから呼ばれる）"""
+    found = []
+    stack = [(root, root_mtime)]
+    while stack:
+        dirpath, mtime = stack.pop()
+        scanned = _scan_dir(dirpath, ignore_known_garbage, fast_rescan, mtime)
+        if scanned is None:
+            continue
+        empty, subdirs = scanned
+        if empty:
+            found.append(dirpath)
+        stack.extend(subdirs)
+        if progress_cb:
+            n = next(counter)  # count の next() はスレッド間でも重複しない
+            if n % SCAN_PROGRESS_EVERY == 0:
+                progress_cb(n, 0, os.path.basename(dirpath) or dirpath)
+    return found
+
 
 def find_empty_folders(
     root_paths: Iterable[str],
     ignore_known_garbage: bool = True,
     fast_rescan: bool = False,
+    progress_cb: Callable[[int, int, str], None] | None = None,
+    max_workers: int | None = None,
 ) -> List[str]:
     """
-    渡された複数ルート配下の“空フォルダ”を再帰列挙（重複除去/ソート済み）。
+    渡された複数ルート配下の“空フォルダ”を再帰列挙（重複除去済み・順不同）。
+    表示用の並べ替えは呼び出し側で行う（削除側は深さ順に並べ直すため不要）。
     - ignore_known_garbage: 既知ゴミファイル(Thumbs等)は無視して空扱い。
-    - fast_rescan: 同一セッション内の再検索で、mtimeと“実質要素数”キャッシュを使って高速化。
+    - fast_rescan: 再検索で、mtimeと“実質要素数”キャッシュを使って高速化（キャッシュは起動をまたいで保存される）。
+      mtime が前回と同じでキャッシュ上「空」のフォルダは開かずに空と判定し、
+      それ以外は走査時の1回の scandir で判定してキャッシュを更新する（削除時の判定にも使われる）。
+    - progress_cb: 走査済みフォルダ数を SCAN_PROGRESS_EVERY 件ごとに通知（総数は不明なので 0）。
+      ワーカースレッドから呼ばれる点に注意。
+    - max_workers: サブツリー並列走査のスレッド数（省略時 SCAN_WORKERS）。
+      複数の呼び出しを同時に走らせる側は、全体の同時数が収まるよう分けて渡す。
+    各ルートの直下サブフォルダごとにスレッドプールで並列に走査する。
     """
-    found = []
-
-    # ★ローカル関数 is_dir_empty_cached は削除
+    top_found = []  # ルート自身の判定結果
+    subroots = []   # 並列に走査する直下サブフォルダ
 
-    for root in root_paths:
+    for root in dict.fromkeys(root_paths):  # 同じルートの重複指定は1回だけ
         if not os.path.isdir(root):
             continue
-        # topdown=False で、深い階層から順に評価
-        for dirpath, dirnames, filenames in os.walk(root, topdown=False):
-            # ★ utils.is_dir_empty_cached を呼ぶように変更
-            if utils.is_dir_empty_cached(dirpath, ignore_known_garbage, fast_rescan):
-                found.append(dirpath)
+        scanned = _scan_dir(root, ignore_known_garbage, fast_rescan)
+        if scanned is None:
+            continue
+        empty, subdirs = scanned
+        if empty:
+            top_found.append(root)
+        subroots.extend(subdirs)
+
+    if subroots:
+        workers = max(1, max_workers or SCAN_WORKERS)
+        with ThreadPoolExecutor(max_workers=min(workers, len(subroots))) as ex:
+            counter = count(1)
+            futures = [
+                ex.submit(_walk_collect, p, mt, ignore_known_garbage, fast_rescan, counter, progress_cb)
+                for p, mt in subroots
+            ]
+            results = [f.result() for f in futures]
+    else:
+        results = []
 
-    # 重複除去＆パスでソート
-    return sorted(list(set(found)))
+    found = []
+    seen = set()  # ルート同士が重なった場合の重複除去用
+    for path in chain(top_found, chain.from_iterable(results)):
+        if path not in seen:
+            seen.add(path)
+            found.append(path)
+    return found
 
 def delete_empty_folders(
     folders: List[str],
@@ -44,13 +172,15 @@ def delete_empty_folders(
     ignore_known_garbage_for_empty: bool = True,
     max_pass: int = 3,
     fast_rescan: bool = False, # ★ fast_rescan 引数を追加
+    scan_workers: int | None = None,
 ) -> int:
     """
     空フォルダを深い階層から削除。削除成功時に親フォルダも対象に加え、
     max_pass 回まで全体を再試行することでネストした空フォルダに対応する。
-    - remove_known_garbage_files: 既知ゴミファイルを先に消してから判定/削除
-    - ignore_known_garbage_for_empty: “実質空”判定で既知ゴミを無視
+    - remove_known_garbage_files: 既知ゴミファイルを先に消してから判定/削除（同じ scandir で判定）
+    - ignore_known_garbage_for_empty: “実質空”判定で既知ゴミを無視（ゴミを消さない時に使う）
     - fast_rescan: 判定時にキャッシュを利用するか
+    - scan_workers: まとめて判定する時のスレッド数（None なら utils.SCAN_MANY_WORKERS）
     戻り値: 削除できた件数（合計）
     """
     if not folders:
@@ -64,6 +194,22 @@ def delete_empty_folders(
     total_target_initial = len(target_set)
     # 実際に処理した（進捗にカウントした）フォルダのセット
     progress_counted_set = set()
+    last_cb_ts = 0.0  # 直近に progress_cb を呼んだ時刻（通知は間引く）
+    # フォルダ名の切り出しは通知する時だけ行う。rpartition(os.sep) は
+    # Windows で "/" 区切りのパス（Qt のダイアログ由来）を扱えないので使わない
+    _basename = os.path.basename
+
+    # ループ内で何度も引くグローバル/属性はローカルに束縛しておく
+    _isdir = os.path.isdir
+    _rmdir = os.rmdir
+    _dirname = os.path.dirname
+    _clean_and_check_empty = utils._clean_and_check_empty
+    _is_dir_empty_cached = utils.is_dir_empty_cached
+    _cache_on_delete = utils.cache_on_delete
+    _save_error_log = utils.save_error_log
+    _discard = target_set.discard
+    _add_target = target_set.add
+    _mark_counted = progress_counted_set.add
 
     # max_pass 回、削除を試行
     for attempt in range(1, max_pass + 1):
@@ -72,31 +218,51 @@ def delete_empty_folders(
 
         deleted_in_pass = 0
         
-        # 常に深い順で処理するために、毎回ソート
-        current_targets_sorted = sorted(list(target_set), key=len, reverse=True)
+        # 深い順で処理するため、パスの開始時にだけスナップショットをソート
+        # （パス中は target_set を discard/add するだけで並べ直さない）
+        current_targets_sorted = sorted(target_set, key=len, reverse=True)
+        # ゴミを消さない場合は判定だけなので、パス開始時にまとめて並列に判定しておく
+        # （このパス中に子を消して対象に追加した親は、結果が古いのでその場で判定し直す）
+        if remove_known_garbage_files:
+            prefetched = {}
+        else:
+            # 既に消えたフォルダは先に除く（判定に回すと FileNotFoundError がログに残る）
+            existing = [f for f in current_targets_sorted if _isdir(f)]
+            if len(existing) != len(current_targets_sorted):
+                target_set.intersection_update(existing)
+                current_targets_sorted = existing
+            prefetched = utils.scan_many_empty(
+                current_targets_sorted, ignore_known_garbage_for_empty, fast_rescan, workers=scan_workers
+            )
+        touched = set()  # このパス中に子が消えたフォルダ
 
         for folder in current_targets_sorted:
             
             # このフォルダを進捗としてカウントしたか？ (初回のみカウント)
             if folder not in progress_counted_set:
-                 progress_counted_set.add(folder)
+                 _mark_counted(folder)
                  if progress_cb:
-                    progress_val = min(len(progress_counted_set), total_target_initial)
-                    basename = os.path.basename(folder) or folder
-                    progress_cb(progress_val, total_target_initial, basename)
+                    now = monotonic()
+                    if now - last_cb_ts >= PROGRESS_INTERVAL:
+                        last_cb_ts = now
+                        progress_val = min(len(progress_counted_set), total_target_initial)
+                        progress_cb(progress_val, total_target_initial, _basename(folder) or folder)
 
             try:
-                if not os.path.isdir(folder):
+                if not _isdir(folder):
                     # 既に無ければ（親が先に消えたなどで）リストから除外
-                    target_set.discard(folder)
+                    _discard(folder)
                     continue
 
                 if remove_known_garbage_files:
-                    utils._delete_known_garbage(folder) # ★ utils. 経由に変更
+                    # ゴミ削除と空判定を1回の scandir でまとめて行う
+                    is_empty = _clean_and_check_empty(folder)
+                elif folder in prefetched and folder not in touched:
+                    is_empty = prefetched[folder]
+                else:
+                    is_empty = _is_dir_empty_cached(folder, ignore_known_garbage_for_empty, fast_rescan)
 
-                # ★ _is_effectively_empty を utils.is_dir_empty_cached に変更
-                # ★ fast_rescan を渡す
-                if utils.is_dir_empty_cached(folder, ignore_known_garbage_for_empty, fast_rescan):
+                if is_empty:
                     try:
                         # 既存の権限に書き込み・実行権限を追加
                         current_mode = os.stat(folder).st_mode
@@ -104,31 +270,33 @@ def delete_empty_folders(
                     except Exception:
                         pass # 失敗しても rmdir は試行
                         
-                    os.rmdir(folder) # フォルダ削除
+                    _rmdir(folder) # フォルダ削除
                     
                     deleted_in_pass += 1
                     deleted_total += 1
-                    target_set.discard(folder) # 削除成功
-                    utils.cache_clear_under(folder) # 削除したのでキャッシュクリア
+                    _discard(folder) # 削除成功
+                    _cache_on_delete(folder) # 削除したので自身を外し、親を無効化
 
                     # --- ★重要：親フォルダを次のパスの処理対象に追加 ---
-                    parent = os.path.dirname(folder)
+                    parent = _dirname(folder)
                     if parent and parent != folder:
                         # 親を次のチェック対象に追加する
-                        target_set.add(parent)
+                        _add_target(parent)
+                        touched.add(parent)
 
             except Exception as e:
                 # 権限エラーなどで削除失敗した場合、target_set に残るので
                 # 次のパスでリトライされる
-                utils.save_error_log(folder, f"{type(e).__name__}: {e}")
+                _save_error_log(folder, f"{type(e).__name__}: {e}")
         
         # このパスで何も削除できなかったら、もう空になるフォルダはない
         if deleted_in_pass == 0:
             break  
 
-    # 最後に残った（エラーなどで削除できなかった）フォルダのキャッシュもクリア
+    # 最後に残った（エラーなどで削除できなかった）フォルダは中身が変わった可能性があるので
+    # 自身のキャッシュだけ無効化（配下は手を付けていないのでそのまま使える）
     for f in target_set:
-        utils.cache_clear_under(f)
+        utils.cache_invalidate(f)
         
     # 進捗を100%にする
     if progress_cb:
@@ -1,23 +1,123 @@
+import atexit
+import json
 import os
+import queue
 import sys
 import stat # ★追加
-from datetime import datetime
-from typing import Optional, Dict, Tuple, Sequence # ★Sequence 追加
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional, Dict, Tuple, FrozenSet, Sequence
 
 APP_TITLE = "空フォルダ削除ツール"
 LOG_PREFIX = "[ERRORLOG][空フォルダ削除]"
 
-# processor.py から移動
-IGNORABLE_FILES: Sequence[str] = ("Thumbs.db", "desktop.ini", ".DS_Store")
+# processor.py から移動（in 判定はハッシュ1回で済むよう frozenset）
+IGNORABLE_FILES: FrozenSet[str] = frozenset(("Thumbs.db", "desktop.ini", ".DS_Store"))
 
-SCAN_CACHE: Dict[str, Tuple[float, int]] = {}
+class _CacheTrie:
+    """
+    パスを区切り文字ごとの階層に分けて持つキャッシュ。
+    配下の一括削除（clear_under）が全キー走査ではなく、パスの深さ分の辿りで済む。
+    各ノード: {"children": {区切り単位の名前: ノード}, "value": (mtime_ns, 実質要素数) or None}
+    """
 
+    def __init__(self):
+        self._root = {"children": {}, "value": None}
+
+    @staticmethod
+    def _split(path: str):
+        # "/foo/bar/" と "/foo/bar"、Windows の "/" 区切り（Qt 由来）を同じキーに揃える
+        segs = os.path.normpath(path).split(os.sep)
+        if len(segs) > 1 and not segs[-1]:
+            # "/" や "C:\" のようなルートは normpath 後も区切りで終わるので、
+            # 末尾の空要素を落として配下のキー（"/a" -> ["", "a"]）と同じ節点に揃える
+            segs.pop()
+        return segs
+
+    def get(self, path: str) -> Optional[Tuple[int, int]]:
+        node = self._root
+        for seg in self._split(path):
+            node = node["children"].get(seg)
+            if node is None:
+                return None
+        return node["value"]
+
+    def set(self, path: str, mtime_ns: int, effective_count: int) -> None:
+        node = self._root
+        for seg in self._split(path):
+            children = node["children"]
+            child = children.get(seg)
+            if child is None:
+                # 名前は intern して、同じ名前のフォルダ間で文字列を共有する
+                child = children[sys.intern(seg)] = {"children": {}, "value": None}
+            node = child
+        node["value"] = (mtime_ns, effective_count)
+
+    def clear_under(self, root: str) -> None:
+        """root 自身とその配下のノードを丸ごと外す"""
+        *parents, last = self._split(root)
+        node = self._root
+        for seg in parents:
+            node = node["children"].get(seg)
+            if node is None:
+                return
+        node["children"].pop(last, None)
+
+    def invalidate(self, path: str) -> None:
+        """path 自身の値だけを消す（配下の値は残す）"""
+        node = self._root
+        for seg in self._split(path):
+            node = node["children"].get(seg)
+            if node is None:
+                return
+        node["value"] = None
+
+    def items(self):
+        """(パス, 値) を列挙（保存用）"""
+        sep = os.sep
+        stack = [((), self._root)]
+        while stack:
+            segs, node = stack.pop()
+            if node["value"] is not None:
+                # ルート（"/" や "C:\"）は区切りを付けて戻す
+                yield (sep.join(segs) if len(segs) > 1 else segs[0] + sep), node["value"]
+            for name, child in node["children"].items():
+                stack.append((segs + (name,), child))
+
+SCAN_CACHE = _CacheTrie()
+# Linux (ext4/xfs 等) ではフォルダのリンク数が「2 + 子フォルダ数」になるので、
+# 2 より大きければ子フォルダあり＝空ではないと分かる。
+# Windows (NTFS/FAT) はこの規則が成り立たず、macOS (APFS) はファイルも数えるため対象外。
+# btrfs などはリンク数が常に 1 なので、判定に使われないだけで誤判定はしない。
+_NLINK_COUNTS_SUBDIRS = sys.platform.startswith("linux")
+# Windows: ゴミを無視しない判定は Shlwapi の PathIsDirectoryEmptyW 1回で済ませる
+# （Shlwapi は MAX_PATH 制限があるので、長いパスは従来の scandir で判定）
+_PathIsDirectoryEmptyW = None
+_WIN_MAX_PATH = 260
+if sys.platform == "win32":
+    try:
+        import ctypes
+        from ctypes import wintypes
+        _PathIsDirectoryEmptyW = ctypes.windll.shlwapi.PathIsDirectoryEmptyW
+        _PathIsDirectoryEmptyW.argtypes = [wintypes.LPCWSTR]
+        _PathIsDirectoryEmptyW.restype = wintypes.BOOL
+    except Exception:
+        _PathIsDirectoryEmptyW = None
+# scan_many_empty の既定スレッド数（I/O待ちが主なので CPU 数より多め）
+SCAN_MANY_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+# 並列スキャン（スレッドプール）から触るのでロックで保護
+_CACHE_LOCK = threading.Lock()
+
+@lru_cache(maxsize=None)
 def app_dir() -> str:
     """実行ファイルと同階層（exe時）/スクリプトのあるディレクトリ（通常時）"""
     if hasattr(sys, "_MEIPASS"):
         return os.path.dirname(sys.executable)
     return os.path.dirname(os.path.abspath(sys.argv[0]))
 
+@lru_cache(maxsize=None)
 def resource_path(name: str) -> str:
     """PyInstaller --onefile 同梱リソースの参照（存在しなくてもそのまま返す）"""
     if hasattr(sys, "_MEIPASS"):
@@ -30,87 +130,346 @@ def resource_path(name: str) -> str:
     script_side = os.path.join(app_dir(), name)
     return script_side
 
-def save_error_log(target_path: str, error_message: str, file_name: Optional[str] = None) -> str:
-    """エラー内容をログテキストで保存し、そのファイルパスを返す"""
-    now = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-    base = file_name or f"{LOG_PREFIX}{now}.txt"
-    out_path = os.path.join(app_dir(), base)
+# エラーログは1プロセス1ファイルに追記する（最初のエラー時に開き、終了時に閉じる）
+# 書き込みは専用スレッドがキューから順に行い、走査・削除側はキューに積むだけで先に進む
+# _LOG_LOCK はパス/スレッド/終了フラグとキュー投入だけを守り、ディスクI/Oの間は持たない
+_LOG_LOCK = threading.Lock()
+_log_path: Optional[str] = None
+_LOG_Q: "queue.Queue[Optional[tuple]]" = queue.Queue()
+_log_thread: Optional[threading.Thread] = None
+_log_shutdown = False  # 終了処理後はスレッドを介さず直接書く
+# ログファイルへの書き込み/クローズ用（ログスレッドと、終了後の同期書き込みが使う）
+_FH_LOCK = threading.Lock()
+_log_fh = None
+
+def _error_log_path(now: str) -> str:
+    """このプロセスのログファイルパス（最初のエラー時刻で決める）※_LOG_LOCK 内で呼ぶ"""
+    global _log_path
+    if _log_path is None:
+        _log_path = os.path.join(app_dir(), f"{LOG_PREFIX}{now}_{os.getpid()}.txt")
+    return _log_path
+
+def _write_error_log(now: str, target_path: str, error_message: str,
+                     out_path: str, separate: bool, flush: bool = True) -> None:
+    """1件分を書き込む（separate なら out_path に単独で、それ以外はプロセスのログに追記）"""
+    global _log_fh
     lines = [
         f"エラー発生時刻: {now}",
         f"対象パス: {target_path}",
         f"エラー内容: {error_message}",
         "",
     ]
-    with open(out_path, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
-    return out_path
+    if separate:
+        with open(out_path, "w", encoding="utf-8") as f:
+            f.writelines(f"{l}\n" for l in lines)
+        return
+
+    with _FH_LOCK:
+        if _log_fh is None:
+            _log_fh = open(out_path, "a", encoding="utf-8")
+        _log_fh.writelines(f"{l}\n" for l in lines)  # 連結した大きな文字列は作らない
+        if flush:
+            _log_fh.flush()  # 実行中にログを開いても読めるよう書き出す（open/close はしない）
 
-def cache_get(path: str) -> Optional[Tuple[float, int]]:
+def _log_worker() -> None:
+    while True:
+        item = _LOG_Q.get()
+        if item is None:
+            break
+        try:
+            # 後続が溜まっている間は flush せず、まとめて書き出す
+            _write_error_log(*item, flush=_LOG_Q.empty())
+        except Exception:
+            pass  # ログが書けなくても処理は止めない
+
+def _shutdown_error_log() -> None:
+    """終了時: キューに残ったログを書き切ってからファイルを閉じる"""
+    global _log_fh, _log_shutdown
+    with _LOG_LOCK:
+        _log_shutdown = True  # 以降の save_error_log は同期書き込み（キューは読まれなくなる）
+        thread = _log_thread
+    if thread is not None:
+        _LOG_Q.put(None)
+        thread.join(timeout=5)
+    with _FH_LOCK:
+        if _log_fh is not None:
+            _log_fh.close()
+            _log_fh = None
+
+atexit.register(_shutdown_error_log)
+
+def save_error_log(target_path: str, error_message: str, file_name: Optional[str] = None) -> str:
+    """
+    エラー内容をログテキストに書き、そのファイルパスを返す。
+    通常はプロセスごとの1ファイルに追記。file_name を指定した時だけ別ファイルに保存する。
+    書き込みはログ用スレッドで行う（終了処理の後に呼ばれた場合はその場で書く）。
+    """
+    global _log_thread
+    now = time.strftime("%Y-%m-%d_%H-%M-%S")
+    separate = bool(file_name)
+    with _LOG_LOCK:
+        path = os.path.join(app_dir(), file_name) if separate else _error_log_path(now)
+        if not _log_shutdown:
+            if _log_thread is None:
+                _log_thread = threading.Thread(target=_log_worker, name="error-log", daemon=True)
+                _log_thread.start()
+            # ロック内で積むので、終了処理の停止指示より前に積んだ分は必ず書かれる
+            _LOG_Q.put((now, target_path, error_message, path, separate))
+            return path
+    _write_error_log(now, target_path, error_message, path, separate)
+    return path
+
+def cache_get(path: str) -> Optional[Tuple[int, int]]:
     """キャッシュ値を返す（なければNone）"""
-    return SCAN_CACHE.get(path)
+    with _CACHE_LOCK:
+        return SCAN_CACHE.get(path)
 
-def cache_set(path: str, mtime: float, effective_count: int) -> None:
+def cache_set(path: str, mtime_ns: int, effective_count: int) -> None:
     """キャッシュを更新"""
-    SCAN_CACHE[path] = (mtime, effective_count)
+    with _CACHE_LOCK:
+        SCAN_CACHE.set(path, mtime_ns, effective_count)
 
 def cache_clear_under(root: str) -> None:
     """指定ルート配下のキャッシュをざっくり掃除（削除後などに呼ぶと安全）"""
-    to_del = [k for k in SCAN_CACHE.keys() if k.startswith(root)]
-    for k in to_del:
-        SCAN_CACHE.pop(k, None)
+    with _CACHE_LOCK:
+        SCAN_CACHE.clear_under(root)
+
+def cache_invalidate(path: str) -> None:
+    """
+    指定フォルダ自身のキャッシュだけを無効化する。
+    値は自身の mtime（＝直下の増減）にしか依存しないので、中身を変えたフォルダはこれで足りる。
+    配下のフォルダは各自の mtime で照合されるため、変わっていなければヒットのまま残る。
+    """
+    with _CACHE_LOCK:
+        SCAN_CACHE.invalidate(path)
+
+def cache_on_delete(path: str) -> None:
+    """
+    フォルダを1つ削除した直後の更新。自身（と配下）を外し、親は自身の値だけ無効化する。
+    親の要素数を減らして残す方式は、要素数を 0/1 に丸めて持っているので使えない
+    （1 から減らしても他に中身が残っているか分からない）。
+    """
+    parent = os.path.dirname(path)
+    with _CACHE_LOCK:
+        SCAN_CACHE.clear_under(path)
+        if parent and parent != path:
+            SCAN_CACHE.invalidate(parent)
+
+# 起動をまたいでキャッシュを引き継ぐためのファイル（実行ファイルと同階層）
+CACHE_FILE_NAME = "scan_cache.json"
+_LOAD_BATCH = 5000
+# 起動時の読み込みが終わるまでクリアしておく（普段はセット済み）
+_CACHE_LOADED = threading.Event()
+_CACHE_LOADED.set()
+
+def load_cache() -> None:
+    """
+    保存済みキャッシュを読み込む（起動時に1回）。ファイルを読むだけでフォルダには触らない。
+    壊れた値は読み飛ばす。消えたフォルダの分は prune_cache で後から捨てる。
+    """
+    path = os.path.join(app_dir(), CACHE_FILE_NAME)
+    try:
+        # 保存側と同じく surrogatepass（デコードできない名前のフォルダも往復させる）
+        with open(path, "r", encoding="utf-8", errors="surrogatepass") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return
+    except Exception as e:
+        save_error_log(path, f"{type(e).__name__}: {e}")
+        return
+    if not isinstance(data, dict):
+        return
+    entries = []
+    for p, value in data.items():
+        # 値は [mtime_ns(int), 0/1] だけを受け付ける
+        # （旧形式の float 秒や、手で壊れた値は照合に使えないので捨てる）
+        if not (isinstance(value, list) and len(value) == 2):
+            continue
+        mtime_ns, cnt = value
+        if type(mtime_ns) is not int or cnt not in (0, 1) or type(cnt) is not int:
+            continue
+        entries.append((p, mtime_ns, cnt))
+    # 一括でロックを握ると読み込み中に始めた検索が止まるので、小分けにして入れる
+    for i in range(0, len(entries), _LOAD_BATCH):
+        with _CACHE_LOCK:
+            for p, mtime_ns, cnt in entries[i:i + _LOAD_BATCH]:
+                # 読み込み中に検索が入れた新しい値は上書きしない
+                if SCAN_CACHE.get(p) is None:
+                    SCAN_CACHE.set(p, mtime_ns, cnt)
+
+def _load_cache_worker() -> None:
+    try:
+        load_cache()
+        prune_cache()
+    finally:
+        _CACHE_LOADED.set()
+
+def load_cache_in_background() -> None:
+    """
+    load_cache → prune_cache を別スレッドで行う（ウィンドウ表示後に呼ぶ）。
+    数十万件あると読み込みだけで秒単位かかるため UI スレッドでは読まない。
+    """
+    _CACHE_LOADED.clear()
+    threading.Thread(target=_load_cache_worker, name="cache-load", daemon=True).start()
+
+def prune_cache() -> None:
+    """
+    親フォルダが消えたキャッシュを捨てる（load_cache の後に別スレッドで呼ぶ）。
+    切断されたネットワーク共有では isdir がタイムアウトまで待つことがあるので UI スレッドでは呼ばない。
+    """
+    with _CACHE_LOCK:
+        parents = {os.path.dirname(p) for p, _ in SCAN_CACHE.items()}
+    # 存在確認はロックの外で行う（検索中のキャッシュ参照を止めない）
+    missing = [d for d in parents if d and not os.path.isdir(d)]
+    if missing:
+        with _CACHE_LOCK:
+            for d in missing:
+                SCAN_CACHE.clear_under(d)
+
+def save_cache() -> None:
+    """キャッシュをファイルに保存（一時ファイルに書いてから置き換える）"""
+    path = os.path.join(app_dir(), CACHE_FILE_NAME)
+    if not _CACHE_LOADED.is_set():
+        # 読み込み途中で終了した場合は、前回のファイルを一部だけのキャッシュで上書きしない
+        return
+    with _CACHE_LOCK:
+        data = dict(SCAN_CACHE.items())
+    tmp = path + ".tmp"
+    try:
+        # Linux の surrogateescape 名や NTFS の孤立サロゲートを含むパスでも書けるようにする
+        with open(tmp, "w", encoding="utf-8", errors="surrogatepass") as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp, path)
+    except Exception as e:
+        try:
+            os.remove(tmp)  # 書きかけの一時ファイルは残さない
+        except OSError:
+            pass
+        save_error_log(path, f"{type(e).__name__}: {e}")
 
 # === processor.py から移動・統合 ===
 
-def _effective_count(dirpath: str, ignore_known_garbage: bool) -> int:
-    """“実質空”評価での要素数（0なら空扱い）※キャッシュ用"""
+def _is_effectively_nonempty_strict(dirpath: str) -> bool:
+    """既知ゴミを無視する版の _is_effectively_nonempty"""
+    ignorable = IGNORABLE_FILES  # ループ内のグローバル参照を避ける
     try:
-        count = 0
         with os.scandir(dirpath) as it:
             for entry in it:
                 if entry.is_dir(follow_symlinks=False):
-                    return 1  # 子ディレクトリがある時点で空ではない
-                if ignore_known_garbage and entry.name in IGNORABLE_FILES:
+                    return True  # 子ディレクトリがある時点で空ではない
+                if entry.name in ignorable:
                     continue
-                count += 1
-                if count > 0:
-                    return count # 1個でも見つかったら即終了
-        return 0
+                return True  # ゴミ以外が1個でも見つかったら即終了
+        return False
     except Exception as e:
         save_error_log(dirpath, f"{type(e).__name__}: {e}")
-        return 1  # 不明なら空ではない扱い
+        return True  # 不明なら空ではない扱い
+
+def _is_effectively_nonempty_keep_garbage(dirpath: str) -> bool:
+    """既知ゴミも中身として扱う版の _is_effectively_nonempty（何か1件あれば空ではない）"""
+    if _PathIsDirectoryEmptyW is not None and len(dirpath) < _WIN_MAX_PATH:
+        # 中身を1件も許さない判定なら列挙は不要（失敗時も FALSE＝空ではない扱い）
+        return not _PathIsDirectoryEmptyW(dirpath)
+    try:
+        with os.scandir(dirpath) as it:
+            return next(it, None) is not None
+    except Exception as e:
+        save_error_log(dirpath, f"{type(e).__name__}: {e}")
+        return True  # 不明なら空ではない扱い
+
+def _is_effectively_nonempty(dirpath: str, ignore_known_garbage: bool) -> bool:
+    """“実質空”評価で中身があるか（False なら空扱い）。ループ内で分岐しないよう版を選ぶ"""
+    if ignore_known_garbage:
+        return _is_effectively_nonempty_strict(dirpath)
+    return _is_effectively_nonempty_keep_garbage(dirpath)
+
+def _is_empty_with_mtime(p: str, st: os.stat_result, ignore_known_garbage: bool) -> bool:
+    """取得済みの stat でキャッシュを照合し、外れたら再計測してキャッシュ更新"""
+    mtime = st.st_mtime_ns  # ns 単位の整数で比べる（float の丸め誤差で外れない）
+    cached = cache_get(p)
+    if cached and cached[0] == mtime:
+        # 更新日時が同じ＝変更なし とみなし、キャッシュ値を返す
+        return cached[1] == 0
+
+    if _NLINK_COUNTS_SUBDIRS and st.st_nlink > 2:
+        # 子フォルダがある（リンク数 = 2 + 子フォルダ数）ので scandir せずに非空
+        cache_set(p, mtime, 1)
+        return False
+
+    # 変更あり or 新規 -> 再計測してキャッシュ更新（キャッシュ上の要素数は 0/1）
+    nonempty = _is_effectively_nonempty(p, ignore_known_garbage)
+    cache_set(p, mtime, 1 if nonempty else 0)
+    return not nonempty
 
 def is_dir_empty_cached(p: str, ignore_known_garbage: bool, fast_rescan: bool) -> bool:
+    """“実質空”か（fast_rescan 時は mtime とキャッシュで再計測を省く）"""
     # 高速リスキャンが有効じゃないなら、キャッシュを使わず普通にカウント
     if not fast_rescan:
-        return _effective_count(p, ignore_known_garbage) == 0
-    
+        return not _is_effectively_nonempty(p, ignore_known_garbage)
+
     # --- キャッシュ利用ロジック ---
     try:
+        # パスで渡されるのはルートや削除後の親。ルートがリンク/ジャンクションでも
+        # 中身の変化を見落とさないよう、リンク先の mtime を見る
         st = os.stat(p)
     except FileNotFoundError:
         return False # 既に消えてる
-        
-    cached = cache_get(p)
-    if cached and cached[0] == st.st_mtime:
-        # 更新日時が同じ＝変更なし とみなし、キャッシュ値を返す
-        return cached[1] == 0
-        
-    # 変更あり or 新規 -> 再計測してキャッシュ更新
-    cnt = _effective_count(p, ignore_known_garbage)
-    cache_set(p, st.st_mtime, cnt)
-    return cnt == 0
-
-def _delete_known_garbage(dirpath: str) -> None:
-    """既知ゴミファイルを削除（存在する場合のみ）。失敗はログに書いて続行。"""
+    return _is_empty_with_mtime(p, st, ignore_known_garbage)
+
+def scan_many_empty(
+    dirpaths: Sequence[str],
+    ignore_known_garbage: bool,
+    fast_rescan: bool,
+    workers: Optional[int] = None,
+) -> Dict[str, bool]:
+    """
+    複数フォルダの“実質空”判定をスレッドプールでまとめて行う（{パス: 空か}）。
+    scandir 中は GIL が外れるので、ネットワークドライブ等で待ち時間を重ねられる。
+    キャッシュへの書き込みは cache_set のロックで保護される。
+    """
+    if len(dirpaths) < 2:
+        return {p: is_dir_empty_cached(p, ignore_known_garbage, fast_rescan) for p in dirpaths}
+    n = min(workers or SCAN_MANY_WORKERS, len(dirpaths))
+    with ThreadPoolExecutor(max_workers=n) as ex:
+        results = ex.map(lambda p: is_dir_empty_cached(p, ignore_known_garbage, fast_rescan), dirpaths)
+        return dict(zip(dirpaths, results))
+
+def _clean_and_check_empty(dirpath: str) -> bool:
+    """
+    既知ゴミファイルを削除しつつ、同じ1回の scandir で“実質空”かを判定する。
+    子フォルダ・通常ファイル・消せなかったゴミが残れば False。失敗はログに書いて続行。
+    """
+    ignorable = IGNORABLE_FILES  # ループ内のグローバル参照を避ける
+    _remove = os.remove
+    is_win = sys.platform == "win32"
+    remaining = False
     try:
         with os.scandir(dirpath) as it:
             for entry in it:
-                if entry.is_file(follow_symlinks=False) and entry.name in IGNORABLE_FILES:
+                if entry.is_dir(follow_symlinks=False):
+                    return False  # 子ディレクトリがある時点で空ではない
+                if entry.is_file(follow_symlinks=False) and entry.name in ignorable:
                     try:
-                        # 読み取り専用属性を解除してから削除
-                        os.chmod(entry.path, stat.S_IWUSR | stat.S_IRUSR)
-                        os.remove(entry.path)
+                        try:
+                            _remove(entry.path)  # ほとんどは書き込み可能なのでまず消す
+                        except PermissionError:
+                            # 読み取り専用の時だけ属性を解除して再試行（DirEntry の stat なので追加I/Oなし）
+                            # それ以外の権限エラーは chmod しても消せないのでそのまま失敗扱い
+                            st = entry.stat(follow_symlinks=False)
+                            if is_win:
+                                readonly = st.st_file_attributes & stat.FILE_ATTRIBUTE_READONLY
+                            else:
+                                readonly = not (st.st_mode & stat.S_IWUSR)
+                            if not readonly:
+                                raise
+                            os.chmod(entry.path, stat.S_IMODE(st.st_mode) | stat.S_IWUSR | stat.S_IRUSR)
+                            _remove(entry.path)
                     except Exception as e:
                         save_error_log(entry.path, f"{type(e).__name__}: {e}")
+                        remaining = True
+                else:
+                    remaining = True
     except Exception as e:
         save_error_log(dirpath, f"{type(e).__name__}: {e}")
+        return False  # 不明なら空ではない扱い
+    return not remaining